@@ -6,6 +6,7 @@ This TUI depends on the Minesweeper game logic via dependency injection.
 
 import curses
 import sys
+import numpy as np
 from minesweeper import Minesweeper, GameState, CellState
 
 
@@ -26,7 +27,22 @@ class MinesweeperTUI:
         self.initial_rows = game.rows
         self.initial_cols = game.cols
         self.initial_mines = game.total_mines
-    
+        # Color attributes, filled in by setup_colors
+        self.colors = [0] * 8
+        self.cursor_attr = 0
+        self.game_over_cursor_attr = 0
+        # Snapshot of what is currently on screen, for dirty-cell redraws
+        self._prev_state = None
+        self._prev_cursor = (0, 0)
+        self._prev_game_state = game.game_state
+        self._precompute_layout()
+
+    def _precompute_layout(self):
+        """Precompute the header and label strings, fixed per board shape."""
+        self._header = "   " + " ".join(f"{i:2}" for i in range(self.game.cols))
+        self._separator = "  " + "---" * self.game.cols
+        self._row_labels = tuple(f"{row:2}|" for row in range(self.game.rows))
+
     def setup_colors(self):
         """Set up color pairs for the display."""
         if curses.has_colors():
@@ -39,6 +55,12 @@ class MinesweeperTUI:
             curses.init_pair(5, curses.COLOR_BLUE, curses.COLOR_BLACK)     # Numbers
             curses.init_pair(6, curses.COLOR_CYAN, curses.COLOR_BLACK)     # Hidden
             curses.init_pair(7, curses.COLOR_WHITE, curses.COLOR_RED)      # Game over
+
+        # Cache the pair attributes once; color_pair is a library call and
+        # the draw loop needs one attribute per cell per frame
+        self.colors = [curses.color_pair(i) for i in range(8)]
+        self.cursor_attr = self.colors[4] | curses.A_REVERSE
+        self.game_over_cursor_attr = self.colors[7] | curses.A_REVERSE
     
     def get_cell_display_char(self, row: int, col: int) -> tuple:
         """
@@ -54,64 +76,99 @@ class MinesweeperTUI:
         cell = self.game.grid[row][col]
         
         if cell.state == CellState.FLAGGED:
-            return ('x', curses.color_pair(3))
+            return ('x', self.colors[3])
         elif cell.state == CellState.HIDDEN:
-            return ('■', curses.color_pair(6))
+            return ('■', self.colors[6])
         elif cell.is_mine:
-            return ('*', curses.color_pair(2))
+            return ('*', self.colors[2])
         elif cell.adjacent_mines > 0:
-            return (str(cell.adjacent_mines), curses.color_pair(5))
+            return (str(cell.adjacent_mines), self.colors[5])
         else:
-            return (' ', curses.color_pair(1))
+            return (' ', self.colors[1])
     
+    def _draw_cell(self, stdscr, row: int, col: int):
+        """Draw a single cell, applying cursor highlighting."""
+        char, color = self.get_cell_display_char(row, col)
+
+        if row == self.cursor_row and col == self.cursor_col:
+            if self.game.game_state == GameState.PLAYING:
+                color = self.cursor_attr
+            else:
+                color = self.game_over_cursor_attr
+
+        stdscr.addstr(row + 2, 3 + col * 3, f" {char}", color)
+
     def draw_board(self, stdscr):
-        """Draw the minesweeper board."""
-        # Clear screen
-        stdscr.clear()
-        
-        # Draw column headers
-        header = "   " + " ".join(f"{i:2}" for i in range(self.game.cols))
-        stdscr.addstr(0, 0, header, curses.color_pair(1))
-        stdscr.addstr(1, 0, "  " + "---" * self.game.cols, curses.color_pair(1))
-        
-        # Draw board
-        for row in range(self.game.rows):
-            # Row header
-            stdscr.addstr(row + 2, 0, f"{row:2}|", curses.color_pair(1))
-            
-            for col in range(self.game.cols):
-                char, color = self.get_cell_display_char(row, col)
-                
-                # Highlight cursor position
-                if row == self.cursor_row and col == self.cursor_col:
-                    if self.game.game_state == GameState.PLAYING:
-                        color = curses.color_pair(4) | curses.A_REVERSE
-                    else:
-                        color = curses.color_pair(7) | curses.A_REVERSE
-                
-                stdscr.addstr(row + 2, 3 + col * 3, f" {char}", color)
-        
-        # Draw status information
-        status_row = self.game.rows + 4
-        stdscr.addstr(status_row, 0, f"Mines remaining: {self.game.get_remaining_mines()}", curses.color_pair(1))
-        stdscr.addstr(status_row + 1, 0, f"Game state: {self.game.game_state.value.upper()}", curses.color_pair(1))
-        
-        if self.game.game_state == GameState.WON:
-            stdscr.addstr(status_row + 2, 0, "🎉 CONGRATULATIONS! YOU WON! 🎉", curses.color_pair(3) | curses.A_BOLD)
-        elif self.game.game_state == GameState.LOST:
-            stdscr.addstr(status_row + 2, 0, "💥 GAME OVER! YOU HIT A MINE! 💥", curses.color_pair(2) | curses.A_BOLD)
-        
-        # Draw controls
-        controls_row = status_row + 4
-        stdscr.addstr(controls_row, 0, "Controls:", curses.color_pair(1) | curses.A_BOLD)
-        stdscr.addstr(controls_row + 1, 0, "  Arrow keys / hjkl: Move cursor", curses.color_pair(1))
-        stdscr.addstr(controls_row + 2, 0, "  'r': Reveal cell", curses.color_pair(1))
-        stdscr.addstr(controls_row + 3, 0, "  'm': Mark/unmark cell", curses.color_pair(1))
-        stdscr.addstr(controls_row + 4, 0, "  'c': Chord reveal (middle-click)", curses.color_pair(1))
-        stdscr.addstr(controls_row + 5, 0, "  'F2': Restart game", curses.color_pair(1))
-        stdscr.addstr(controls_row + 6, 0, "  'ESC': Quit", curses.color_pair(1))
-        
-        stdscr.refresh()
+        """Draw the minesweeper board, repainting only what changed."""
+        game = self.game
+
+        # A full redraw is needed on the first frame, after a restart, and
+        # when the game ends (to show the banner). Otherwise only the cells
+        # whose state changed plus the cursor need repainting.
+        full_redraw = (self._prev_state is None
+                       or self._prev_state.shape != game.state.shape
+                       or self._prev_game_state != game.game_state)
+
+        if full_redraw:
+            stdscr.clear()
+
+            # Draw column headers
+            stdscr.addstr(0, 0, self._header, self.colors[1])
+            stdscr.addstr(1, 0, self._separator, self.colors[1])
+
+            # Draw board
+            for row in range(game.rows):
+                # Row header
+                stdscr.addstr(row + 2, 0, self._row_labels[row], self.colors[1])
+
+                # Write the whole row in its dominant color in one call,
+                # then overlay the few cells (and the cursor) that differ
+                cells = [self.get_cell_display_char(row, col) for col in range(game.cols)]
+                row_colors = [color for _, color in cells]
+                base_color = max(set(row_colors), key=row_colors.count)
+                stdscr.addstr(row + 2, 3, "".join(f" {char}" for char, _ in cells), base_color)
+                for col, (char, color) in enumerate(cells):
+                    if color != base_color:
+                        stdscr.addstr(row + 2, 3 + col * 3, f" {char}", color)
+                if row == self.cursor_row:
+                    self._draw_cell(stdscr, row, self.cursor_col)
+
+            if game.game_state == GameState.WON:
+                stdscr.addstr(game.rows + 6, 0, "🎉 CONGRATULATIONS! YOU WON! 🎉", self.colors[3] | curses.A_BOLD)
+            elif game.game_state == GameState.LOST:
+                stdscr.addstr(game.rows + 6, 0, "💥 GAME OVER! YOU HIT A MINE! 💥", self.colors[2] | curses.A_BOLD)
+
+            # Draw controls
+            controls_row = game.rows + 8
+            stdscr.addstr(controls_row, 0, "Controls:", self.colors[1] | curses.A_BOLD)
+            stdscr.addstr(controls_row + 1, 0, "  Arrow keys / hjkl: Move cursor", self.colors[1])
+            stdscr.addstr(controls_row + 2, 0, "  'r': Reveal cell", self.colors[1])
+            stdscr.addstr(controls_row + 3, 0, "  'm': Mark/unmark cell", self.colors[1])
+            stdscr.addstr(controls_row + 4, 0, "  'c': Chord reveal (middle-click)", self.colors[1])
+            stdscr.addstr(controls_row + 5, 0, "  'F2': Restart game", self.colors[1])
+            stdscr.addstr(controls_row + 6, 0, "  'ESC': Quit", self.colors[1])
+        else:
+            # Repaint dirty cells (reveals, flags) and the cursor move
+            for row, col in zip(*np.nonzero(game.state != self._prev_state)):
+                self._draw_cell(stdscr, int(row), int(col))
+
+            prev_row, prev_col = self._prev_cursor
+            self._draw_cell(stdscr, prev_row, prev_col)
+            self._draw_cell(stdscr, self.cursor_row, self.cursor_col)
+
+        # Status lines change on any flag or reveal; trailing spaces erase
+        # leftovers from previously longer values
+        status_row = game.rows + 4
+        stdscr.addstr(status_row, 0, f"Mines remaining: {game.get_remaining_mines()}  ", self.colors[1])
+        stdscr.addstr(status_row + 1, 0, f"Game state: {game.game_state.name}  ", self.colors[1])
+
+        self._prev_state = game.state.copy()
+        self._prev_cursor = (self.cursor_row, self.cursor_col)
+        self._prev_game_state = game.game_state
+
+        # Batch the flush instead of refreshing mid-draw
+        stdscr.noutrefresh()
+        curses.doupdate()
     
     def handle_input(self, key):
         """
@@ -132,6 +189,9 @@ class MinesweeperTUI:
             self.game = Minesweeper(self.initial_rows, self.initial_cols, self.initial_mines)
             self.cursor_row = 0
             self.cursor_col = 0
+            self._prev_state = None  # force a full redraw of the new board
+            self._prev_game_state = self.game.game_state
+            self._precompute_layout()
             return True
         
         # Arrow key navigation and Vi bindings
@@ -0,0 +1,123 @@
+import base64
+import copy
+import hashlib
+import pickle
+import sys
+import os
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from minesweeper import Minesweeper
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--cached-boards", action="store_true",
+        help="persist prototype boards in the pytest cache across runs",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): group tests onto one pytest-xdist worker",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Keep scenarios from the same feature file together.
+
+    Scenarios sharing a feature file share board patterns, so running them
+    consecutively — and, under pytest-xdist with --dist=loadgroup, on the
+    same worker — maximizes pattern_cache hits per worker.
+    """
+    items.sort(key=lambda item: item.location[0])
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=item.location[0]))
+
+
+# Every slot the steps touch, preallocated; attribute access skips the
+# dict hashing that the earlier per-module `{}` fixtures paid per step.
+_CONTEXT_DEFAULTS = dict(game=None,
+                         mine_coords=None, safe_coords=None,
+                         last_reveal_result=None, last_flag_result=None,
+                         last_chord_result=None, second_reveal_result=None,
+                         ready=False)
+
+
+@pytest.fixture(scope="module")
+def game_context():
+    """
+    Context shared between the steps of one scenario.
+
+    One namespace per module, wiped between scenarios by the autouse
+    reset below instead of reallocated for every test.
+    """
+    return SimpleNamespace(**_CONTEXT_DEFAULTS)
+
+
+@pytest.fixture(autouse=True)
+def _reset_game_context(game_context):
+    """Reset the shared context's slots before each scenario."""
+    game_context.__dict__.update(_CONTEXT_DEFAULTS)
+
+
+class _PersistentPatternCache(dict):
+    """
+    Pattern cache backed by pytest's cacheprovider.
+
+    Prototypes are pickled into .pytest_cache so repeated local runs skip
+    board construction entirely. Opt-in via --cached-boards, since a stale
+    cache would silently mask changes to the board setup code.
+    """
+
+    def __init__(self, cache):
+        super().__init__()
+        self._cache = cache
+
+    @staticmethod
+    def _key(pattern):
+        return "minesweeper/proto/" + hashlib.sha1(pattern.encode()).hexdigest()
+
+    def get(self, pattern, default=None):
+        prototype = super().get(pattern)
+        if prototype is None:
+            blob = self._cache.get(self._key(pattern), None)
+            if blob is not None:
+                prototype = pickle.loads(base64.b64decode(blob))
+                super().__setitem__(pattern, prototype)
+        return prototype if prototype is not None else default
+
+    def __setitem__(self, pattern, prototype):
+        super().__setitem__(pattern, prototype)
+        blob = base64.b64encode(
+            pickle.dumps(prototype, pickle.HIGHEST_PROTOCOL)).decode("ascii")
+        self._cache.set(self._key(pattern), blob)
+
+
+@pytest.fixture(scope="session")
+def pattern_cache(request):
+    """Session-wide cache of prototype games keyed by board pattern."""
+    if request.config.getoption("--cached-boards"):
+        return _PersistentPatternCache(request.config.cache)
+    return {}
+
+
+def game_from_pattern(pattern_cache, pattern):
+    """
+    Get a game set up from the given board pattern.
+
+    Parsing a pattern and computing its adjacency counts is the same work
+    for every scenario that uses the same board, so build one prototype per
+    unique pattern and hand each scenario a deep copy.
+    """
+    prototype = pattern_cache.get(pattern)
+    if prototype is None:
+        prototype = Minesweeper()
+        prototype.setup_board_from_pattern(pattern)
+        pattern_cache[pattern] = prototype
+    return copy.deepcopy(prototype)
@@ -0,0 +1,175 @@
+"""
+Step definitions shared across the BDD test modules.
+
+Each shared Given/When/Then used to be copy-pasted into every test file,
+so pytest built one parser object and step registration per copy. Defining
+them once here and star-importing keeps a single definition per step.
+"""
+
+import numpy as np
+from pytest_bdd import given, when, then, parsers
+
+from minesweeper import Minesweeper, CellState, GameState
+from conftest import game_from_pattern
+
+
+# Given steps
+
+@given('I want to start a new game')
+def want_new_game(game_context):
+    """Initialize the game context."""
+    game_context.ready = True
+
+@given('the board is:', target_fixture='board_pattern')
+def board_pattern(docstring):
+    """Expose the board pattern docstring as a fixture."""
+    return docstring
+
+@given(parsers.parse('I have a {rows:d}x{cols:d} Minesweeper game with {mines:d} mine'))
+@given(parsers.parse('I have a {rows:d}x{cols:d} Minesweeper game with {mines:d} mines'))
+def create_custom_game(game_context, rows, cols, mines):
+    """Create a custom Minesweeper game with specified dimensions and mines."""
+    game_context.game = Minesweeper(rows, cols, mines)
+
+def _board_coords(game_context):
+    """
+    Mine and safe coordinate lists for the scenario's board.
+
+    Computed once per scenario with argwhere and cached on the context, so
+    the traversal steps iterate plain coordinate tuples instead of walking
+    every cell view again per step.
+    """
+    if game_context.mine_coords is None:
+        is_mine = game_context.game.is_mine
+        game_context.mine_coords = [(int(r), int(c)) for r, c in np.argwhere(is_mine)]
+        game_context.safe_coords = [(int(r), int(c)) for r, c in np.argwhere(~is_mine)]
+    return game_context.mine_coords, game_context.safe_coords
+
+def _reveal_cells(game_context, strategy):
+    """
+    Reveal cells selected by a named traversal strategy.
+
+    One body serves the reveal-everything style steps ("safe", "all",
+    "mine") instead of each step repeating the board walk.
+    """
+    game = game_context.game
+    if game.first_move:
+        # Generated games place their mines on the first reveal, so the
+        # board can only be indexed afterwards; a first reveal is never
+        # a mine.
+        game.reveal(0, 0)
+        game_context.mine_coords = None
+    mine_coords, safe_coords = _board_coords(game_context)
+    if strategy == "mine":
+        row, col = mine_coords[0]
+        return game.reveal(row, col)
+    coords = safe_coords if strategy == "safe" else safe_coords + mine_coords
+    for row, col in coords:
+        game.reveal(row, col)
+        # Auto-reveal cascades or a hit mine can end the game mid-walk;
+        # every remaining reveal() would just be refused, so stop early.
+        if game.is_game_over():
+            break
+    return None
+
+# When steps
+
+@when('I set up the game with this board pattern')
+def setup_game_with_pattern(game_context, pattern_cache, board_pattern):
+    """Set up the game using the board pattern from docstring."""
+    game_context.game = game_from_pattern(pattern_cache, board_pattern)
+
+@when(parsers.parse('I reveal cell at row {row:d}, column {col:d}'))
+@when(parsers.parse('I reveal cell ({row:d},{col:d})'))
+def reveal_cell(game_context, row, col):
+    """Reveal a cell at the specified coordinates."""
+    game = game_context.game
+    result = game.reveal(row, col)
+    game_context.last_reveal_result = result
+
+@when(parsers.parse('I flag cell at row {row:d}, column {col:d}'))
+def flag_cell(game_context, row, col):
+    """Flag a cell at the specified coordinates."""
+    game = game_context.game
+    result = game.flag(row, col)
+    game_context.last_flag_result = result
+
+@when('I reveal all cells except the mine')
+def reveal_all_safe_cells(game_context):
+    """Reveal all cells except the mines."""
+    _reveal_cells(game_context, "safe")
+
+# Then steps
+
+@then(parsers.parse('the game state should be "{state}"'))
+@then(parsers.parse('the game state should remain "{state}"'))
+def check_game_state(game_context, state):
+    """Verify the game state matches expected value."""
+    game = game_context.game
+    expected_state = GameState(state)
+    assert game.get_game_state() is expected_state
+
+@then(parsers.parse('the cell at row {row:d}, column {col:d} should be revealed'))
+def check_cell_revealed(game_context, row, col):
+    """Verify that a cell is revealed."""
+    game = game_context.game
+    cell = game.grid[row][col]
+    assert cell.state is CellState.REVEALED, f"Cell at ({row}, {col}) should be revealed but is {cell.state.value}"
+
+@then(parsers.parse('the board should be {rows:d}x{cols:d}'))
+def check_board_dimensions(game_context, rows, cols):
+    """Verify the board has the correct dimensions."""
+    game = game_context.game
+    assert game.rows == rows
+    assert game.cols == cols
+
+@then(parsers.parse('the remaining mines count should be {count:d}'))
+def check_remaining_mines(game_context, count):
+    """Verify the remaining mines count."""
+    game = game_context.game
+    assert game.get_remaining_mines() == count
+
+@then(parsers.parse('the flags placed count should be {count:d}'))
+def check_flags_placed(game_context, count):
+    """Verify the flags placed count."""
+    game = game_context.game
+    assert game.flags_placed == count
+
+@then('the reveal operation should fail')
+def check_reveal_failed(game_context):
+    """Verify that the last reveal operation failed."""
+    assert game_context.last_reveal_result == False
+
+@then('the mine should be revealed')
+def check_mine_revealed(game_context):
+    """Verify that at least one mine is revealed."""
+    game = game_context.game
+    assert (game.is_mine & game.state_mask(CellState.REVEALED)).any(), \
+        "No mine was revealed"
+
+@then('all cells should be revealed')
+def check_all_cells_revealed(game_context):
+    """Verify all cells on the board are revealed."""
+    game = game_context.game
+    assert game.state_mask(CellState.REVEALED).all(), \
+        f"Unrevealed cells at {np.argwhere(~game.state_mask(CellState.REVEALED)).tolist()}"
+
+@then('all safe cells should be revealed')
+def check_all_safe_cells_revealed(game_context):
+    """Verify all safe cells are revealed."""
+    game = game_context.game
+    unrevealed_safe = ~game.is_mine & ~game.state_mask(CellState.REVEALED)
+    assert not unrevealed_safe.any(), \
+        f"Safe cells not revealed at {np.argwhere(unrevealed_safe).tolist()}"
+
+@then('the game should be over')
+def check_game_over(game_context):
+    """Verify the game is over."""
+    game = game_context.game
+    assert game.is_game_over()
+
+@then('the game should not be over')
+def check_game_not_over(game_context):
+    """Verify the game is not over."""
+    game = game_context.game
+    assert not game.is_game_over()